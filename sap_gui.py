@@ -1,19 +1,24 @@
 import random
 import sys
 import time
-import locale
 import logging
 import win32gui
 import win32con
-import win32api
+import win32event
+import pythoncom
+import winreg
+import shutil
 import subprocess
-import pygetwindow as gw
+import threading
 import win32com.client as win32
 import os
-import psutil
-from datetime import datetime, timedelta
-from typing import Optional, Tuple, Any, Dict
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple, Any, Dict, Callable, Iterable
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Module logger; handlers and format are left to the application
+logger = logging.getLogger(__name__)
 
 class SapConfigError(Exception):
     """Custom exception for SAP configuration errors."""
@@ -52,46 +57,287 @@ class SapGuiError(Exception):
     """Custom exception for SAP GUI related errors"""
     pass
 
-def run_application(software: str) -> bool:
+def _pump_wait(seconds: float) -> None:
     """
-    Search for and run an application on the system.
+    Block for the given time while servicing this thread's window messages.
+
+    Unlike time.sleep, MsgWaitForMultipleObjects wakes on incoming messages,
+    so COM calls and callbacks queued for this thread are pumped during waits.
 
     Args:
-        software (str): Application executable name to find and run
+        seconds: Time to wait in seconds
+    """
+    deadline = time.monotonic() + seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        rc = win32event.MsgWaitForMultipleObjects([], False, int(remaining * 1000), win32event.QS_ALLINPUT)
+        if rc == win32event.WAIT_TIMEOUT:
+            return
+        pythoncom.PumpWaitingMessages()
+
+def _wait_until(
+    predicate: Callable[[], Any],
+    timeout: float,
+    interval: float = 0.1,
+    backoff: float = 1.0,
+    max_interval: float = 0.5
+) -> Any:
+    """
+    Poll a predicate until it returns a truthy value or the timeout expires.
+
+    Exceptions raised by the predicate are treated as "not ready yet".
+
+    Args:
+        predicate: Callable evaluated on every poll
+        timeout: Maximum wait time in seconds
+        interval: Delay between polls in seconds
+        backoff: Factor applied to the delay after each poll
+        max_interval: Upper bound for the delay when backoff is used
 
     Returns:
-        bool: True if application found and launched successfully
+        Any: The first truthy predicate result, or None on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = predicate()
+            if result:
+                return result
+        except Exception:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        _pump_wait(min(interval, remaining))
+        if backoff != 1.0:
+            interval = min(interval * backoff, max_interval)
+
+def _find_window(title: str) -> int:
+    """
+    Find a visible top-level window by title.
+
+    Tries an exact match with FindWindow first, then falls back to a
+    case-insensitive substring match over EnumWindows that stops at the
+    first hit. Hidden windows are ignored.
+
+    Args:
+        title: Window title or part of it
+
+    Returns:
+        int: Window handle, or 0 if no window matches
     """
-    def search_drive(drive: str, software: str) -> Optional[str]:
-        for root, _, files in os.walk(drive):
-            if software in files:
-                return os.path.join(root, software)
+    hwnd = win32gui.FindWindow(None, title)
+    if hwnd and win32gui.IsWindowVisible(hwnd):
+        return hwnd
+
+    target = title.casefold()
+    found = []
+
+    def callback(hwnd: int, _: Any) -> bool:
+        if win32gui.IsWindowVisible(hwnd) and target in win32gui.GetWindowText(hwnd).casefold():
+            found.append(hwnd)
+            return False
+        return True
+
+    try:
+        win32gui.EnumWindows(callback, None)
+    except win32gui.error:
+        # EnumWindows reports an error when the callback stops enumeration
+        if not found:
+            raise
+    return found[0] if found else 0
+
+# Capitalized Portuguese month names, indexed by month number
+PT_MONTH_NAMES = (
+    "", "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+    "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+)
+
+# Registry key under which installers (SAP GUI included) register executables
+APP_PATHS_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"
+
+# Canonical SAP GUI install directories
+SAPGUI_INSTALL_DIRS = (
+    r"C:\Program Files (x86)\SAP\FrontEnd\SAPGUI",
+    r"C:\Program Files\SAP\FrontEnd\SAPGUI",
+)
+
+# Directories that never hold program installs, skipped by the fallback search
+SEARCH_EXCLUDED_DIRS = frozenset({"$Recycle.Bin", "WinSxS", "WindowsApps", "Package Cache", "Temp"})
+
+# Maximum directory depth below each root visited by the fallback search
+SEARCH_MAX_DEPTH = 6
+
+# Resolved executable paths, kept for the lifetime of the process
+_resolved_paths: Dict[str, str] = {}
+
+def find_application(software: str) -> Optional[str]:
+    """
+    Resolve the full path of an application executable.
+
+    Lookup order: registry App Paths, PATH, canonical SAP GUI install
+    directories and, as a last resort, a parallel walk of the Program Files folders.
+    The result is cached so later lookups in the same process are free.
+
+    Args:
+        software (str): Application executable name or path
+
+    Returns:
+        Optional[str]: Full path to the executable, or None if not found
+    """
+    if software in _resolved_paths:
+        return _resolved_paths[software]
+
+    # A configured full path that does not exist is still looked up by file name
+    executable = os.path.basename(software)
+
+    def from_registry() -> Optional[str]:
+        key_path = f"{APP_PATHS_KEY}\\{executable}"
+        # SAP GUI is 32-bit, so its entry may only exist in the WOW6432Node view
+        for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+            for view in (winreg.KEY_WOW64_64KEY, winreg.KEY_WOW64_32KEY):
+                try:
+                    with winreg.OpenKey(hive, key_path, 0, winreg.KEY_READ | view) as key:
+                        value, _ = winreg.QueryValueEx(key, "")
+                except OSError:
+                    continue
+                value = os.path.expandvars(value.strip('"'))
+                if os.path.isfile(value):
+                    return value
         return None
 
-    def is_process_running(process_name: str) -> bool:
-        for proc in psutil.process_iter(['pid', 'name']):
-            if process_name.lower() in proc.info['name'].lower():
-                return True
-        return False
+    def from_install_dirs() -> Optional[str]:
+        for directory in SAPGUI_INSTALL_DIRS:
+            candidate = os.path.join(directory, executable)
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    found = threading.Event()
+
+    def search_root(root_dir: str) -> Optional[str]:
+        # Depth-limited scandir walk; DirEntry type checks reuse the directory listing
+        target = executable.casefold()
+        stack = [(root_dir, 0)]
+        while stack and not found.is_set():
+            directory, depth = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            if entry.name.casefold() == target:
+                                found.set()
+                                return entry.path
+                        elif (entry.is_dir(follow_symlinks=False)
+                              and depth < SEARCH_MAX_DEPTH
+                              and not entry.name.startswith(("$", "."))
+                              and entry.name not in SEARCH_EXCLUDED_DIRS):
+                            stack.append((entry.path, depth + 1))
+            except OSError:
+                continue
+        return None
+
+    def search_program_files() -> Optional[str]:
+        roots = dict.fromkeys((os.environ.get("ProgramFiles"), os.environ.get("ProgramFiles(x86)")))
+        roots = [root_dir for root_dir in roots if root_dir]
+        if not roots:
+            return None
+
+        # The walks are I/O bound, so search each root in its own thread
+        with ThreadPoolExecutor(max_workers=len(roots)) as executor:
+            futures = [executor.submit(search_root, root_dir) for root_dir in roots]
+            for future in as_completed(futures):
+                software_path = future.result()
+                if software_path:
+                    return software_path
+        return None
+
+    if os.path.isfile(software):
+        software_path = software
+    else:
+        software_path = (
+            from_registry()
+            or shutil.which(executable)
+            or from_install_dirs()
+            or search_program_files()
+        )
+
+    if software_path:
+        _resolved_paths[software] = software_path
+    return software_path
+
+# Last process lookup as (name, expiry, result)
+_process_state: Tuple[str, float, bool] = ("", 0.0, False)
+
+def _remember_process_state(process_name: str, running: bool) -> None:
+    """Memoize a process lookup for SapGui.DEFAULT_TIMEOUT seconds"""
+    global _process_state
+    _process_state = (process_name.casefold(), time.monotonic() + SapGui.DEFAULT_TIMEOUT, running)
+
+def _forget_process_state() -> None:
+    """Drop the memoized process lookup so the next check queries tasklist"""
+    global _process_state
+    _process_state = ("", 0.0, False)
 
+def is_process_running(process_name: str) -> bool:
+    """
+    Check whether a process with the given image name is running.
+
+    Queries tasklist filtered by image name instead of enumerating every
+    process through psutil. The result is memoized for DEFAULT_TIMEOUT seconds.
+
+    Args:
+        process_name (str): Executable name or path (e.g. 'saplogon.exe')
+
+    Returns:
+        bool: True if a matching process is running
+    """
+    image_name = os.path.basename(process_name)
+    target = image_name.casefold()
+    name, expiry, running = _process_state
+    if name == target and time.monotonic() < expiry:
+        return running
+
+    out = subprocess.run(
+        ["tasklist", "/FI", f"IMAGENAME eq {image_name}", "/NH", "/FO", "CSV"],
+        capture_output=True,
+        text=True,
+        creationflags=subprocess.CREATE_NO_WINDOW
+    ).stdout
+    # CSV rows start with the quoted image name; compare it exactly
+    running = any(line.split(",", 1)[0].strip('"').casefold() == target for line in out.splitlines())
+    _remember_process_state(image_name, running)
+    return running
+
+def run_application(software: str) -> bool:
+    """
+    Find and run an application on the system.
+
+    Args:
+        software (str): Application executable name to find and run
+
+    Returns:
+        bool: True if application found and launched successfully
+    """
     if is_process_running(software):
-        logging.info(f"{software} is already running")
+        logger.info(f"{software} is already running")
         return True
 
     start_time = time.time()
-    drives = win32api.GetLogicalDriveStrings().split('\000')[:-1]
-
-    for drive in drives:
-        software_path = search_drive(drive, software)
-        if software_path:
-            elapsed_time = time.time() - start_time
-            logging.info(f"{software} found at {software_path}. Starting...")
-            subprocess.Popen(software_path)
-            logging.info(f"Time taken: {elapsed_time:.2f} seconds")
-            return True
-
+    software_path = find_application(software)
     elapsed_time = time.time() - start_time
-    logging.warning(f"{software} not found. Search time: {elapsed_time:.2f} seconds")
+
+    if software_path:
+        logger.info(f"{software} found at {software_path}. Starting...")
+        # ShellExecute returns immediately and leaves no child handles behind
+        os.startfile(software_path)
+        _remember_process_state(os.path.basename(software), True)
+        logger.info(f"Time taken: {elapsed_time:.2f} seconds")
+        return True
+
+    logger.warning(f"{software} not found. Search time: {elapsed_time:.2f} seconds")
     return False
 
 class SapGui:
@@ -137,7 +383,17 @@ class SapGui:
     # Class constants
     DEFAULT_TIMEOUT = 60
     DEFAULT_RETRY_ATTEMPTS = 3
-    RETRY_DELAY = 1
+    BASE_DELAY = 1.0
+    MAX_DELAY = 30.0
+    JITTER = 0.5
+    STARTUP_TIMEOUT = 10
+
+    # Casefolded popup texts identifying login prompts
+    _PWD_PROMPT = "nova senha"
+    _MULTI_LOGIN_PROMPT = "logon múltiplo".casefold()
+
+    # Last get_dates result as (day computed, dates)
+    _dates_cache: Optional[Tuple[date, Tuple[str, str]]] = None
 
     def __init__(self, sap_args: dict):
         """
@@ -149,10 +405,10 @@ class SapGui:
         Raises:
             SapGuiError: If initialization fails
         """
+        self._el_cache: Dict[str, Any] = {}
         try:
             config = SapConfig(**sap_args)
             self._initialize_connection(config)
-            self._setup_logging()
         except Exception as e:
             raise SapGuiError(f"Failed to initialize SAP GUI: {str(e)}") from e
 
@@ -167,13 +423,14 @@ class SapGui:
             config: SapConfig instance containing connection parameters
 
         Raises:
+            SapConfigError: If SAPLogon cannot be found (not retried)
             SapGuiError: If connection fails after maximum retry attempts
 
         Note:
-            Performs connection steps with delays to ensure stable initialization:
+            Performs connection steps, waiting on each readiness condition:
             1. Launches SAPLogon executable
             2. Connects to SAP GUI automation engine
-            3. Opens connection to specified SAP system
+            3. Attaches to an open connection to the SAP system, or opens one
             4. Initializes session and configures window
         """
         self.config = config
@@ -185,54 +442,115 @@ class SapGui:
                 # Find and execute SAPLogon
                 runner = run_application(config.path)
                 if not runner:
-                    raise Exception("Failed to run SAPLogon.")
-
-                # subprocess.Popen(self.path)
-                time.sleep(2)  # Give it some time to open
+                    raise SapConfigError(f"Failed to run SAPLogon: {config.path} not found")
 
-                # Connect to the SAP GUI Scripting engine
-                self.SapGuiAuto = win32.GetObject("SAPGUI")
-                if not isinstance(self.SapGuiAuto, win32.CDispatch):
-                    return None
+                # Connect to the SAP GUI Scripting engine as soon as SAPLogon registers it
+                self.SapGuiAuto = _wait_until(lambda: win32.GetObject("SAPGUI"), self.STARTUP_TIMEOUT)
+                if self.SapGuiAuto is None:
+                    raise SapGuiError("SAPGUI COM object unavailable")
 
                 # Get the SAP Scripting engine
                 application = self.SapGuiAuto.GetScriptingEngine
-                if not isinstance(application, win32.CDispatch):
+                if application is None:
                     self.SapGuiAuto = None
-                    return None
+                    raise SapGuiError("SAP GUI scripting engine unavailable")
+
+                # Reuse an open connection to the SAP system, or open a new one
+                if not self._attach_connection(application, config):
+                    self.connection = application.OpenConnection(config.platform, True)
 
-                # Open a connection to the SAP system
-                self.connection = application.OpenConnection(config.platform, True)
-                time.sleep(3)
+                    # Wait for the login screen to be ready
+                    if not _wait_until(
+                        lambda: self.connection.Children(0).findById("wnd[0]/usr/txtRSYST-MANDT", False),
+                        self.STARTUP_TIMEOUT
+                    ):
+                        raise SapGuiError("Timed out waiting for SAP login screen")
 
                 self.session = self.connection.Children(0)
-                self.session.findById("wnd[0]").resizeWorkingPane(169, 30, False)
+                self._invalidate_cache()
+                self._el("wnd[0]").resizeWorkingPane(169, 30, False)
                 return
 
+            except SapConfigError:
+                # Configuration problems will not resolve themselves, so don't retry
+                raise
+
             except Exception as e:
+                # SAPLogon may have failed to start or exited; check again on retry
+                _forget_process_state()
                 retry_count += 1
                 if retry_count == self.DEFAULT_RETRY_ATTEMPTS:
                     raise SapGuiError(f"Failed to initialize after {retry_count} attempts: {str(e)}")
-                time.sleep(self.RETRY_DELAY)
-
-    def _setup_logging(self) -> None:
-        """Configure logging with appropriate format and level"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+                time.sleep(self._retry_delay(retry_count))
+
+    def _attach_connection(self, application: Any, config: SapConfig) -> bool:
+        """
+        Attach to an already open connection to the configured SAP system.
+
+        Only connections whose first session is still on the login screen,
+        or is logged in as the configured user and client, are reused.
+
+        Args:
+            application: SAP GUI scripting engine
+            config: SapConfig instance containing connection parameters
+
+        Returns:
+            bool: True if a reusable open connection was found
+        """
+        connections = application.Children
+        for i in range(connections.Count):
+            try:
+                connection = connections(i)
+                if connection.Description != config.platform or not connection.Children.Count:
+                    continue
+                info = connection.Children(0).Info
+                reusable = not info.User or (
+                    info.User.upper() == config.username.upper() and info.Client == config.client
+                )
+            except Exception:
+                # Busy or closing connections can't be probed; don't reuse them
+                continue
+            if reusable:
+                self.connection = connection
+                logger.info(f"Attached to open connection to {config.platform}")
+                return True
+        return False
+
+    def _retry_delay(self, retry_count: int) -> float:
+        """Exponential backoff with jitter, capped at MAX_DELAY seconds"""
+        delay = self.BASE_DELAY * (2 ** (retry_count - 1)) * (1 + random.random() * self.JITTER)
+        return min(self.MAX_DELAY, delay)
+
+    def _el(self, path: str) -> Any:
+        """
+        Get a session-wide SAP GUI element by ID, reusing its handle across calls.
+
+        Only for elements that live as long as the session, such as the main
+        window and its command field; screen-specific elements go through
+        session.findById, since their handles go stale on screen changes.
+
+        Args:
+            path: SAP GUI scripting ID of the element
+
+        Returns:
+            Any: The SAP GUI element
+        """
+        element = self._el_cache.get(path)
+        if element is None:
+            element = self.session.findById(path)
+            self._el_cache[path] = element
+        return element
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached element handles when the session changes"""
+        self._el_cache.clear()
 
     @staticmethod
     def generate_password() -> str:
         """Generate a new password following the required format"""
-        try:
-            locale.setlocale(locale.LC_TIME, 'pt_PT.UTF-8')
-        except locale.Error:
-            logging.warning("Failed to set Portuguese locale, using system default")
-
+        now = datetime.now()
         number = random.randrange(1, 999)
-        return f"{number}{datetime.now().strftime('%B').capitalize()}#{datetime.now().strftime('%Y')}"
+        return f"{number}{PT_MONTH_NAMES[now.month]}#{now.year}"
 
     def scroll_to_field(self, field_path: str) -> None:
         """
@@ -242,11 +560,12 @@ class SapGui:
             field_path: Path to the SAP GUI field element
 
         Note:
-            If direct focus fails, incrementally scrolls the vertical scrollbar
+            If the field is not rendered, incrementally scrolls the vertical scrollbar
         """
-        try:
-            self.session.findById(field_path).setFocus()
-        except Exception:
+        field = self.session.findById(field_path, False)
+        if field:
+            field.setFocus()
+        else:
             parent_path = "/".join(field_path.split("/")[:-1])
             self.session.findById(parent_path).verticalScrollbar.position += 1
 
@@ -265,22 +584,19 @@ class SapGui:
 
         Note:
             Generated password format: {number}{Month}#{Year}
-            Requires Portuguese locale for month formatting
+            Month names are always Portuguese (e.g. 'Março')
         """
         try:
-            # Set Portuguese locale for month formatting
-            try:
-                locale.setlocale(locale.LC_TIME, 'pt_PT.UTF-8')
-            except locale.Error:
-                logging.warning("Portuguese locale unavailable, using system default")
-
             # Check for password change window
-            active_window = self.session.ActiveWindow
-            if active_window.Name != "wnd[1]":
+            popup_window = self.session.findById("wnd[1]", False)
+            if popup_window is None:
                 return True
 
-            popup_window = self.session.findById("wnd[1]")
-            if not "nova senha" in popup_window.findById("usr/lblRSYST-NCODE_TEXT").Text.lower():
+            # Other popups (e.g. multiple logon) are left to their own handlers
+            prompt = popup_window.findById("usr/lblRSYST-NCODE_TEXT", False)
+            if prompt is None:
+                return True
+            if self._PWD_PROMPT not in prompt.Text.casefold():
                 return False
 
             # Generate and set new password
@@ -289,11 +605,13 @@ class SapGui:
             popup_window.findById("usr/pwdRSYST-NCOD2").text = new_password
             popup_window.findById("tbar[0]/btn[0]").press()
 
-            time.sleep(3)
-            return bool(self.session.findById("wnd[0]/tbar[0]/btn[15]", False))
+            return bool(_wait_until(
+                lambda: not self.session.Busy and self.session.findById("wnd[0]/tbar[0]/btn[15]", False),
+                self.STARTUP_TIMEOUT
+            ))
 
         except Exception as e:
-            logging.error(f"Password change failed: {str(e)}")
+            logger.error(f"Password change failed: {str(e)}")
             return False
 
 
@@ -301,7 +619,9 @@ class SapGui:
         """
         Perform SAP system login with comprehensive error handling.
 
-        Executes the complete login sequence including:
+        Skips the login when the session is already authenticated as the
+        configured user and client. Otherwise executes the complete login
+        sequence including:
         - Setting login credentials (client, username, password, language)
         - Handling password change prompts if required
         - Managing multiple login scenarios
@@ -321,15 +641,22 @@ class SapGui:
             - Ensures proper cleanup on login failure
         """
         try:
-            # Set login credentials
-            self.session.findById("wnd[0]/usr/txtRSYST-MANDT").text = self.config.client
-            self.session.findById("wnd[0]/usr/txtRSYST-BNAME").text = self.config.username
-            self.session.findById("wnd[0]/usr/pwdRSYST-BCODE").text = self.config.password
-            self.session.findById("wnd[0]/usr/txtRSYST-LANGU").text = self.config.language
+            # An attached session may already be logged in as the configured user
+            info = self.session.Info
+            if info.User.upper() == self.config.username.upper() and info.Client == self.config.client:
+                logger.info(f"Session already logged in as {info.User}")
+                return True
+
+            # Set login credentials, resolving fields relative to the login container
+            usr = self.session.findById("wnd[0]/usr")
+            usr.findById("txtRSYST-MANDT").text = self.config.client
+            usr.findById("txtRSYST-BNAME").text = self.config.username
+            usr.findById("pwdRSYST-BCODE").text = self.config.password
+            usr.findById("txtRSYST-LANGU").text = self.config.language
 
             # Submit login credentials
-            self.session.findById("wnd[0]").sendVKey(0)
-            time.sleep(2)
+            self._el("wnd[0]").sendVKey(0)
+            _wait_until(self._login_settled, self.STARTUP_TIMEOUT)
 
             if not self.handle_password_change():
                 return False
@@ -341,73 +668,88 @@ class SapGui:
             return False
 
         except Exception as e:
-            logging.error(f"Login failed: {str(e)}")
+            logger.error(f"Login failed: {str(e)}")
             self.close_connection()
             return False
 
+    def _login_settled(self) -> bool:
+        """Check whether SAP has finished processing submitted login credentials"""
+        if self.session.Busy:
+            return False
+        if self.session.findById("wnd[1]", False) or self.session.findById("wnd[0]/tbar[0]/btn[15]", False):
+            return True
+        # Rejected credentials keep the login screen with an error in the status bar
+        return self.session.findById("wnd[0]/sbar").MessageType in ("E", "A")
+
     def _handle_multiple_login(self) -> bool:
         """Handle multiple login scenario"""
         try:
-            if self.session.ActiveWindow.Name == "wnd[1]":
-                if "logon múltiplo" in self.session.findById("wnd[1]").Text:
-                    self.session.findById("wnd[1]/usr/radMULTI_LOGON_OPT1").select()
-                    self.session.findById("wnd[1]/tbar[0]/btn[0]").press()
+            popup_window = self.session.findById("wnd[1]", False)
+            if popup_window is not None and self._MULTI_LOGIN_PROMPT in popup_window.Text.casefold():
+                popup_window.findById("usr/radMULTI_LOGON_OPT1").select()
+                popup_window.findById("tbar[0]/btn[0]").press()
             return True
         except Exception as e:
-            logging.error(f"Multiple login handling failed: {str(e)}")
+            logger.error(f"Multiple login handling failed: {str(e)}")
             return False
 
     def _verify_login(self) -> bool:
         """Verify successful login"""
         try:
-            return bool(self.session.findById("wnd[0]/tbar[0]/btn[15]"))
+            return self.session.findById("wnd[0]/tbar[0]/btn[15]", False) is not None
         except Exception:
             return False
 
     def close_connection(self) -> None:
         """Safely close SAP connection with resource cleanup"""
         try:
+            self._invalidate_cache()
             if self.connection:
-                self.connection.CloseSession('ses[0]')
+                self.connection.CloseSession(self.session.Id)
                 self.connection = None
             if self.SapGuiAuto:
                 self.SapGuiAuto = None
-            logging.info("SAP connection closed safely")
+            logger.info("SAP connection closed safely")
         except Exception as e:
-            logging.error(f"Error closing connection: {str(e)}")
+            logger.error(f"Error closing connection: {str(e)}")
 
     def sapLogout(self) -> None:
         """Perform SAP logout"""
         try:
-            self.session.findById("wnd[0]/tbar[0]/okcd").text = "/nex"
-            self.session.findById("wnd[0]").sendVKey(0)
-            logging.info("Successfully logged out")
+            self._el("wnd[0]/tbar[0]/okcd").text = "/nex"
+            self._el("wnd[0]").sendVKey(0)
+            logger.info("Successfully logged out")
         except Exception as e:
-            logging.error(f"Logout failed: {str(e)}")
+            logger.error(f"Logout failed: {str(e)}")
 
-    @staticmethod
-    def get_dates() -> Tuple[str, str]:
+    @classmethod
+    def get_dates(cls) -> Tuple[str, str]:
         """
         Get start and end dates for the previous month.
 
+        The result is computed once per calendar day.
+
         Returns:
             Tuple containing start_date and end_date strings
         """
-        current_date = datetime.now()
-        first_day_current = current_date.replace(day=1)
-        prev_month_last = first_day_current - timedelta(days=1)
+        today = date.today()
+        if cls._dates_cache and cls._dates_cache[0] == today:
+            return cls._dates_cache[1]
 
-        return (
+        prev_month_last = today.replace(day=1) - timedelta(days=1)
+        dates = (
             prev_month_last.replace(day=1).strftime("%d.%m.%Y"),
-            current_date.strftime("%d.%m.%Y")
+            today.strftime("%d.%m.%Y")
         )
+        cls._dates_cache = (today, dates)
+        return dates
 
     def wait_for_element(self, element_id: str, timeout: int = DEFAULT_TIMEOUT) -> bool:
         """
         Wait for SAP GUI element to become available with timeout.
 
         Repeatedly attempts to find specified element until timeout occurs.
-        Uses polling mechanism with 1-second intervals between attempts.
+        Polls adaptively, starting at 10ms and growing by 1.5x up to 500ms.
 
         Args:
             element_id: SAP GUI scripting ID of target element
@@ -431,53 +773,73 @@ class SapGui:
             - Silently handles exceptions during element search
             - Use for synchronizing automation with SAP UI state
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                if self.session.findById(element_id):
-                    return True
-            except Exception:
-                time.sleep(1)
-        return False
+        return bool(_wait_until(
+            lambda: self.session.findById(element_id, False),
+            timeout,
+            interval=0.01,
+            backoff=1.5
+        ))
 
     def check_element_exists(self, element_path: str) -> bool:
         """Check if SAP element exists"""
         try:
-            self.session.findById(element_path)
-            return True
+            return self.session.findById(element_path, False) is not None
         except Exception:
             return False
 
     def wait_for_save_as_dialog(self, title: str, max_attempts: int = 10) -> bool:
-        """Wait for save dialog with specified title"""
-        for _ in range(max_attempts):
-            if gw.getWindowsWithTitle(title):
-                return True
-            time.sleep(1)
-        return False
+        """Wait up to max_attempts seconds for save dialog with specified title"""
+        return bool(_wait_until(lambda: _find_window(title), max_attempts))
 
     def get_sap_element_text(self, element_path: str) -> Optional[str]:
         """Get text from SAP element with error handling"""
         try:
-            element = self.session.FindById(element_path)
+            element = self.session.findById(element_path)
             return element.Text
         except Exception as e:
-            logging.error(f"Failed to get element text: {str(e)}")
+            logger.error(f"Failed to get element text: {str(e)}")
             return None
 
+    def bulk_get_texts(self, container_path: str, field_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Get the text of several fields of the same container.
+
+        Resolves the container once and finds each field relative to it,
+        like sapLogin does for the credential fields, so the container path
+        is not walked again for every field. Fields that don't exist are
+        skipped.
+
+        Args:
+            container_path: Path to the container (e.g. "wnd[0]/usr")
+            field_ids: Field IDs relative to the container, including the
+                       type prefix (e.g. "ctxtVBAK-AUART")
+
+        Returns:
+            Dict[str, str]: Text of each field found, keyed by its ID
+        """
+        texts = {}
+        try:
+            container = self.session.findById(container_path)
+            for field_id in field_ids:
+                field = container.findById(field_id, False)
+                if field is not None:
+                    texts[field_id] = field.Text
+        except Exception as e:
+            logger.error(f"Failed to get texts from {container_path}: {str(e)}")
+        return texts
+
     def bring_dialog_to_top(self, title: str) -> bool:
         """Bring dialog window to top of screen"""
         try:
-            save_as_window = gw.getWindowsWithTitle(title)
-            if save_as_window:
-                window_handle = save_as_window[0]._hWnd
+            window_handle = _find_window(title)
+            if window_handle:
                 win32gui.ShowWindow(window_handle, win32con.SW_RESTORE)
                 win32gui.ShowWindow(window_handle, win32con.SW_SHOWNORMAL)
                 win32gui.BringWindowToTop(window_handle)
                 return True
             return False
         except Exception as e:
-            logging.error(f"Failed to bring dialog to top: {str(e)}")
+            logger.error(f"Failed to bring dialog to top: {str(e)}")
             return False
 
     def perform_operation(self, command: str, element_to_wait_for: Optional[str] = None, timeout: int = DEFAULT_TIMEOUT) -> bool:
@@ -497,22 +859,58 @@ class SapGui:
         """
         try:
             # Execute command
-            self.session.findById("wnd[0]/tbar[0]/okcd").text = command
-            self.session.findById("wnd[0]").sendVKey(0)
+            self._el("wnd[0]/tbar[0]/okcd").text = command
+            self._el("wnd[0]").sendVKey(0)
 
             # Verify operation if element specified
             if element_to_wait_for:
                 if not self.wait_for_element(element_to_wait_for, timeout):
                     raise SapGuiError(f"Element {element_to_wait_for} not found after command {command}")
-                logging.info(f"Command {command} executed, element {element_to_wait_for} found")
+                logger.info(f"Command {command} executed, element {element_to_wait_for} found")
             else:
-                logging.info(f"Command {command} executed")
+                logger.info(f"Command {command} executed")
             return True
 
         except Exception as e:
-            logging.error(f"Operation failed - Command: {command}, Error: {str(e)}")
+            logger.error(f"Operation failed - Command: {command}, Error: {str(e)}")
             raise SapGuiError(f"Operation failed: {str(e)}")
 
+    def _find_empty_cell(self, column_path: str) -> Tuple[int, Any]:
+        """
+        Locate the first empty cell of a table column.
+
+        For a GuiTableControl the scan reads cells through the table's
+        GetCell accessor, bounded by its VisibleRowCount. Other containers fall
+        back to probing formatted cell paths until an empty or missing cell.
+
+        Args:
+            column_path: Path to table column with a '{}' row placeholder,
+                         e.g. "wnd[0]/usr/tblTABLE/ctxtFIELD[1,{}]"
+
+        Returns:
+            Tuple containing the row number and the cell element
+        """
+        parent_path, _, cell_id = column_path.rpartition("/")
+        table = self.session.findById(parent_path)
+
+        if table.Type == "GuiTableControl":
+            column = int(cell_id[cell_id.rindex("[") + 1:].split(",")[0])
+            for row_number in range(table.VisibleRowCount):
+                cell = table.GetCell(row_number, column)
+                if cell.Text == "":
+                    return row_number, cell
+            raise SapGuiError(f"No empty cell in the visible rows of {parent_path}")
+
+        # Split the template once instead of parsing it with str.format per row
+        prefix, _, rest = column_path.partition("{")
+        _, _, suffix = rest.partition("}")
+        row_number = 0
+        while True:
+            cell = self.session.findById(prefix + str(row_number) + suffix)
+            if not cell or cell.Text == "":
+                return row_number, cell
+            row_number += 1
+
     def set_cell_value(self, column_path: str, text: str) -> int:
         """
         Set value in first empty cell of specified column.
@@ -524,21 +922,14 @@ class SapGui:
         Returns:
             int: Row number where value was set
         """
-        row_number = 0
         try:
-            while True:
-                cell_path = column_path.format(row_number)
-                cell = self.session.findById(cell_path)
-
-                if not cell or cell.Text == "":
-                    cell.Text = text
-                    cell.setFocus()
-                    cell.caretPosition = len(text)
-                    self.session.findById("wnd[0]").sendVKey(0)
-                    return row_number
-
-                row_number += 1
+            row_number, cell = self._find_empty_cell(column_path)
+            cell.Text = text
+            cell.setFocus()
+            cell.caretPosition = len(text)
+            self._el("wnd[0]").sendVKey(0)
+            return row_number
 
         except Exception as e:
-            logging.error(f"Failed to set cell value: {str(e)}")
+            logger.error(f"Failed to set cell value: {str(e)}")
             raise SapGuiError(f"Failed to set cell value: {str(e)}")